@@ -69,11 +69,15 @@ setup(
     ],
     python_requires='>=3.6.1',
     install_requires=[
-        # eg: 'aspectlib==1.1.1', 'six>=1.7',
-        # pandas>=1.0.4, bs4>=0.0.1, yaml>=0.2.5,
-        # numpy>=1.19.1, requests>=2.24.0
+        'pandas>=1.0.4',
+        'lxml',
+        'pyyaml>=5.1',
+        'openpyxl',
     ],
     extras_require={
+        'calamine': ['python-calamine>=0.1.7'],
+        'cache': ['pyarrow'],
+        'xls': ['xlrd>=2.0.1'],
         # eg:
         #   'rst': ['docutils>=0.11'],
         #   ':python_version=="2.6"': ['argparse'],
@@ -25,34 +25,76 @@ Examples
   # get list of files in directory
   fnames = processor.files()
 
-  for file, ext in fnames.items():
-      # load data from file to DataFrame
-      df = processor.load(file, ext[0])
-
-      # process data for upload to data warehouse
-      df = processor.process(file, df, proc_yaml)
+  # load files in parallel and process data for upload to data warehouse
+  for file, df in processor.run(fnames, proc_yaml):
+      print(df.head())
 
 -----------------------------------------------------------------------------------------------------
 """
 
-# find other in-house packages in directory path
-import os, sys, inspect
-
-currentdir = os.path.dirname(
-    os.path.abspath(inspect.getfile(inspect.currentframe()))
-)
-parentdir = os.path.dirname(currentdir)
-sys.path.insert(0, parentdir)
-
 # import standard python packages
+import glob
+import hashlib
+import io
+import multiprocessing
+import os
+import re
+import threading
+import time
+import lxml.html
 import pandas as pd
+import yaml
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain, islice, repeat
+
+# python-calamine (Rust-backed) reads xls and xlsx much faster than openpyxl/xlrd
+try:
+    from python_calamine import CalamineWorkbook
+
+    _CALAMINE = True
+except ImportError:
+    _CALAMINE = False
+
+# pd.read_excel only accepts engine="calamine" from pandas 2.2
+_PD_CALAMINE = _CALAMINE and tuple(
+    int(part) for part in re.findall(r"\d+", pd.__version__)[:2]
+) >= (2, 2)
 
 # import Mixin Classes
-from fileprocr import _fundingcorp
+from . import _fundingcorp
+
+# default (placeholder) worksheet names skipped by the Excel loaders:
+# anything starting with Sheet/sheet, and Excel's numbered defaults in other locales
+_SHEET_SKIP_RE = re.compile(
+    r"Sheet|sheet|(?:Blad|Hoja|Feuil|Tabelle|Foglio|Planilha)\d+$"
+)
+
+# logged when an Excel file has more than one data worksheet
+_MULTI_SHEET_WARNING = (
+    "\n- Warning: multiple worksheets detected. \n\tOnly first worksheet was loaded."
+)
+
+# parquet metadata key recording that a cached Excel file had multiple data worksheets
+_CACHE_MULTI_SHEET_KEY = b"fileprocr.multiple_sheets"
+
+# log lists copied back from worker processes (see FileProcessor.run)
+_LOG_FIELDS = (
+    "log_issues",
+    "log_loads",
+    "log_loadfails",
+    "log_procs",
+    "log_procfails",
+    "log_proctimes",
+)
 
-# import other homegrown modules
-from utilsx.readin import get_fnames, checkdir, read_yaml
+# log section headers written by FileProcessor.write_log
+_HDR_ISSUES = "Warnings or Errors\n------------------"
+_HDR_LOADS = "\n\n\nFiles Successfully Loaded\n-------------------------"
+_HDR_LOADFAILS = "\n\n\nFiles Failing Load\n------------------"
+_HDR_PROCS = "\n\n\nFiles Successfully Processed\n----------------------------"
+_HDR_PROCFAILS = "\n\n\nFiles Failing Processing\n------------------------"
+_HDR_PROCTIMES = "\n\n\nProcessor Run Times\n-------------------"
 
 
 class FileProcessor(_fundingcorp.ProcessFC):
@@ -80,6 +122,16 @@ class FileProcessor(_fundingcorp.ProcessFC):
         Directory path with files to process.
     proc_yaml : str
         Fully qualified path and name of YAML with info on data source specific processors.
+    max_workers : int
+        Number of threads (or processes) used by run() (default min(8, cpu count)).
+    use_cache : bool
+        True to cache loaded DataFrames as parquet files in ./cache (default False).
+    use_processes : bool
+        True for run() to load and process files in worker processes instead of threads (default False).
+    html_match : str
+        Regex an HTML table's text must contain to be loaded (default None, any table).
+    html_attrs : dict
+        HTML attributes a table must have to be loaded, e.g. {"class": "data"} (default None, any table).
 
     Attributes
     -----------
@@ -89,6 +141,15 @@ class FileProcessor(_fundingcorp.ProcessFC):
         Loadable extensions.
     log : file
         Auto-generated log with errors and process status (saved in run directory).
+        Kept open until close_log() is called or the context manager exits.
+    max_workers : int
+        Number of threads (or processes) used by run().
+    sheet_skip_re : re.Pattern
+        Worksheet names matching this regex are skipped when loading Excel files (class attribute).
+    use_processes : bool
+        True if run() uses worker processes instead of threads.
+    cache_path : str
+        Directory where loaded DataFrames are cached (saved in run directory).
 
     Notes
     -------
@@ -98,7 +159,7 @@ class FileProcessor(_fundingcorp.ProcessFC):
 
     * Files are loaded based on format.  A new format can be added by adding a new sub-method that is called by the main `load() method <./fileprocr.html#fileprocr.FileProcessor.FileProcessor.load>`_.
     * Files are processed for specific data sources.  A new source can be added via :ref:`mixin classes <reference-label>`.
-    * When file formats are added, add file extension to self.extensions so user can print list of loadable formats using `loadable_formats() <./fileprocr.html#fileprocr.FileProcessor.FileProcessor.loadable_formats>`_.
+    * When file formats are added, register the new sub-method for the file extension in FileProcessor._LOADERS.  self.extensions (used by `loadable_formats() <./fileprocr.html#fileprocr.FileProcessor.FileProcessor.loadable_formats>`_) and the extension checks in files() and load() are derived from it.
 
     **Processor Data File (YAML)**
 
@@ -128,20 +189,86 @@ class FileProcessor(_fundingcorp.ProcessFC):
     `Multiple inheritance and mixin classes in Python <https://www.thedigitalcatonline.com/blog/2020/03/27/mixin-classes-in-python/>`_
     """
 
-    def __init__(self, dpath):
-
-        # expand self.extensions if a new method to load a file format is added
-        # a new sub-method should also be added below and called by the public load method
+    # override in a subclass (or on an instance) to skip other placeholder sheet names
+    sheet_skip_re = _SHEET_SKIP_RE
+
+    # loadable extensions mapped to their private load sub-methods
+    # add an entry here when a new load sub-method is added below
+    _LOADERS = {
+        "xls": "_FileProcessor__load_excel",
+        "xlsx": "_FileProcessor__load_excel",
+        "html": "_FileProcessor__load_html",
+        "eml": "_FileProcessor__load_html",
+    }
+
+    @property
+    def _ext_set(self):
+        """Loadable extensions (keys of _LOADERS) for O(1) membership checks."""
+        return self._LOADERS.keys()
+
+    def __init__(
+        self,
+        dpath,
+        max_workers=None,
+        use_cache=False,
+        use_processes=False,
+        html_match=None,
+        html_attrs=None,
+    ):
+
+        # register a new sub-method in _LOADERS to add a loadable file format
         # Note: eml and html treated the same
-        self.extensions = ["xls", "xlsx", "html", "eml"]
+        self.extensions = list(self._LOADERS)
 
         self.dpath = dpath
 
+        # when a file's layout is known, only tables matching these are considered
+        self.html_match = re.compile(html_match) if html_match else None
+        self.html_attrs = html_attrs or {}
+
+        # file loads run in a thread or process pool (see run); the lock guards the log lists
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.use_processes = use_processes
+        self._log_lock = threading.Lock()
+
+        # parsed files are cached as parquet and reused while the source file is unchanged
+        self.use_cache = use_cache
+        self.cache_path = "./cache"
+        if self.use_cache:
+            os.makedirs(self.cache_path, exist_ok=True)
+
+        # parsed processor yamls keyed by path: (modification time, contents)
+        self._yaml_cache = {}
+
         # initialize log
         self.create_log()
 
         return
 
+    def __getstate__(self):
+        """Pickle instance for a worker process (see run).
+
+        The log file handle and lock are not copied and the log lists
+        start empty, so a worker only returns the entries it adds.
+        """
+
+        state = self.__dict__.copy()
+        del state["_log_lock"]
+        state.pop("log", None)
+        for field in _LOG_FIELDS:
+            state[field] = []
+
+        return state
+
+    def __setstate__(self, state):
+        """Restore instance in a worker process (see run)."""
+
+        self.__dict__.update(state)
+        self.log = None
+        self._log_lock = threading.Lock()
+
+        return
+
     def create_log(self):
         """Auto-generate a log upon initialization.
 
@@ -162,8 +289,8 @@ class FileProcessor(_fundingcorp.ProcessFC):
         """
 
         log_path = "./logs"
-        checkdir(
-            log_path
+        os.makedirs(
+            log_path, exist_ok=True
         )  # create log subdir if it does not exist in run dir
 
         # logging date-time information
@@ -176,14 +303,15 @@ class FileProcessor(_fundingcorp.ProcessFC):
         self.log_name = f"{log_path}/log_{timestamp}.txt"
 
         # write standard log header to log
-        self.log = open(self.log_name, "w")
+        # the log stays open for write_log until close_log is called
+        self.log = open(self.log_name, "w", buffering=65536)
         self.log.write(log_date)
         message = self.loadable_formats()
         for msg in message:
             self.log.write(msg)
             self.log.write("\n")
         self.log.write("\n\n")
-        self.log.close()
+        self.log.flush()
 
         # create lists to store warnings, errors, and status updates
         # these are written to log when write_log is called
@@ -192,19 +320,25 @@ class FileProcessor(_fundingcorp.ProcessFC):
         self.log_loadfails = []  # files that failed to load to DataFrame
         self.log_procs = []  # files successfully processed (via mixins)
         self.log_procfails = []  # files that failed processing step
+        self.log_proctimes = []  # processor run time per file (see process)
 
         return
 
-    def files(self):
+    def files(self, recursive=False):
         """Get list of file names and their extensions.
 
-        Leveraging utilsx.get_fnames to return a list of all
-        the files in a directory (fully qualified path of directory
-        is given by self.dpath).
+        Scans the directory given by self.dpath (fully qualified path)
+        with os.scandir, which returns file type information with the
+        directory listing instead of a stat call per file.  Only files
+        with a loadable extension (see self.extensions) are returned;
+        other files are logged as load failures.  Each call logs them
+        again, so calling files() more than once on the same instance
+        duplicates those log entries.
 
         Parameters
         -----------
-        None
+        recursive : bool
+            True to include files in subdirectories of self.dpath (default False).
 
         Returns
         --------
@@ -218,10 +352,34 @@ class FileProcessor(_fundingcorp.ProcessFC):
         .. code-block:: text
 
             {"C:/User/doejohn/Documents/My Data File.xlsx":["xlsx"],
-             "C:/User/doejohn/Documents/Another Data File.csv":["csv"]}
+             "C:/User/doejohn/Documents/Another Data File.html":["html"]}
         """
 
-        fnames = get_fnames(self.dpath)
+        if recursive:
+            names = [
+                (root, name)
+                for root, _, files in os.walk(self.dpath, followlinks=False)
+                for name in files
+            ]
+        else:
+            with os.scandir(self.dpath) as entries:
+                names = [
+                    (self.dpath, entry.name) for entry in entries if entry.is_file()
+                ]
+
+        fnames = {}
+        for root, name in names:
+            fname = f"{root}/{name}"
+            fext = os.path.splitext(name)[1][1:].lower()
+            if fext in self._ext_set:
+                fnames[fname] = [fext]
+            else:
+                with self._log_lock:
+                    self.log_issues.append(
+                        f"\n- ERROR: '{fext}' is not a loadable format for {fname}. \n\tNo data loaded."
+                    )
+                    self.log_loadfails.append(f"{fname}")
+                print(f"Skipping... '{fname}' (see log for details)")
 
         return fnames
 
@@ -233,6 +391,10 @@ class FileProcessor(_fundingcorp.ProcessFC):
         exist for a given file format, an error will be logged and an
         empty DataFrame returned.
 
+        When caching is enabled, a file that has not changed since it was
+        last loaded (same modification time and size) is read back from
+        its parquet copy in self.cache_path instead of being parsed again.
+
         Parameters
         -----------
         fname : str
@@ -246,34 +408,273 @@ class FileProcessor(_fundingcorp.ProcessFC):
             DataFrame with file contents.
         """
 
-        if fext not in self.extensions:
-            self.log_issues.append(
-                f"\n- ERROR: '{fext}' is not a loadable format for {fname}. \n\tNo data loaded."
-            )
-            self.log_loadfails.append(f"{fname}")
+        if fext not in self._ext_set:
+            with self._log_lock:
+                self.log_issues.append(
+                    f"\n- ERROR: '{fext}' is not a loadable format for {fname}. \n\tNo data loaded."
+                )
+                self.log_loadfails.append(f"{fname}")
             print(f"Skipping... '{fname}' (see log for details)")
             return pd.DataFrame()
         else:
             print(f"Loading... '{fname}'")
 
-            # Call correct loader sub-method
-            if fext == "xls" or fext == "xlsx":
-                df = self.__load_excel(fname)
-            elif fext == "eml" or fext == "html":
-                df = self.__load_html(fname)
+            df = self.__load_cache(fname)
+            if df is None:
+                # Call correct loader sub-method
+                df = getattr(self, self._LOADERS[fext])(fname)
+
+                self.__save_cache(fname, df)
+
+            with self._log_lock:
+                if not df.empty:
+                    self.log_loads.append(f"{fname}")
+                else:
+                    self.log_loadfails.append(f"{fname}")
+
+        return df
 
+    def load_chunks(self, fname, fext, chunk_rows=50_000):
+        """Load file into a series of DataFrames.
+
+        For very large Excel files.  Rows are read and yielded in chunks
+        so the whole sheet is never held in one DataFrame; pass the result
+        to process() to process each chunk in turn.  Other file formats
+        are loaded with load() and yielded as a single chunk.  Chunked
+        loads are not cached.
+
+        Concatenated chunks hold the same data as load().  Column dtypes are
+        inferred per chunk, so a column with no values in some chunk may come
+        back as object after concatenation.
+
+        Parameters
+        -----------
+        fname : str
+            Fully qualified path and file name to be loaded.
+        fext : str
+            File extension denoting file type of file to be loaded.
+        chunk_rows : int
+            Maximum number of rows per DataFrame (default 50,000).
+
+        Yields
+        --------
+        pd.DataFrame
+            Consecutive chunks of the file's contents.
+
+        Examples
+        ---------
+        .. code-block:: python
+
+          chunks = processor.load_chunks(file, "xlsx")
+          df = processor.process(file, chunks, proc_yaml)
+
+        See Also
+        ---------
+        FileProcessor.load, FileProcessor.process
+        """
+
+        if fext not in ("xls", "xlsx"):
+            df = self.load(fname, fext)
             if not df.empty:
+                yield df
+            return
+
+        print(f"Loading... '{fname}' (in chunks of {chunk_rows} rows)")
+
+        loaded = False
+        for chunk in self.__load_excel_chunked(fname, chunk_rows):
+            loaded = True
+            yield chunk
+
+        with self._log_lock:
+            if loaded:
                 self.log_loads.append(f"{fname}")
             else:
                 self.log_loadfails.append(f"{fname}")
 
-        return df
+    def __cache_slot(self, file):
+        """Get the cache name prefix shared by all versions of a file.
+
+        The prefix holds a hash of the file's absolute path, so files with
+        the same name in different directories never share cache entries.
+
+        Parameters
+        -----------
+        file : str
+            Fully qualified path and file name to be loaded.
+
+        Returns
+        --------
+        str
+            Path and file name prefix of the file's parquet cache entries.
+        """
+
+        abspath = os.path.abspath(file).encode("utf-8")
+        path_hash = hashlib.sha1(abspath).hexdigest()[:16]
+
+        return f"{self.cache_path}/{os.path.basename(file)}.{path_hash}"
+
+    def __cache_name(self, file):
+        """Get name of the cached copy of a file.
+
+        The name is keyed by the file's path, modification time and size
+        so a changed file never matches an older cache entry.  The loader
+        options that decide what is read (self.html_attrs, self.html_match,
+        self.sheet_skip_re) are part of the key too.
+
+        Parameters
+        -----------
+        file : str
+            Fully qualified path and file name to be loaded.
+
+        Returns
+        --------
+        str
+            Path and file name of parquet cache file.
+        """
+
+        options = repr(
+            (
+                sorted(self.html_attrs.items()),
+                self.html_match.pattern if self.html_match else None,
+                self.sheet_skip_re.pattern,
+            )
+        )
+        options_hash = hashlib.sha1(options.encode("utf-8")).hexdigest()[:8]
+
+        stat = os.stat(file)
+        key = f"{options_hash}_{stat.st_mtime}_{stat.st_size}"
+
+        return f"{self.__cache_slot(file)}.{key}.parquet"
+
+    def __load_cache(self, file):
+        """Load cached copy of a file to DataFrame.
+
+        Private file loading sub-method called by load.
+
+        A cache entry that cannot be read is treated as a miss: a warning
+        is logged, a corrupt entry is removed and the file is parsed again.
+        If pyarrow is not installed caching is turned off.  The multiple
+        worksheet warning stored with the entry is logged again on a hit.
+
+        Parameters
+        -----------
+        file : str
+            Fully qualified path and file name to be loaded.
+
+        Returns
+        --------
+        pd.DataFrame or None
+            DataFrame with contents of file; None if caching is off or no current cache exists.
+
+        See Also
+        ---------
+        FileProcessor.load
+        """
+
+        if not self.use_cache:
+            return None
+
+        cached = self.__cache_name(file)
+        try:
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(cached)
+        except FileNotFoundError:
+            return None
+        except ImportError as err:
+            self.use_cache = False
+            with self._log_lock:
+                self.log_issues.append(
+                    f"\n- Warning: parquet cache unavailable ({err}). \n\tCaching turned off."
+                )
+            return None
+        except (OSError, ValueError) as err:
+            # corrupt or truncated entry (pyarrow's ArrowInvalid is a ValueError)
+            with self._log_lock:
+                self.log_issues.append(
+                    f"\n- Warning: could not read cache for '{file}' ({err}). \n\tFile parsed again."
+                )
+            if os.path.exists(cached):
+                os.remove(cached)
+            return None
+
+        if (table.schema.metadata or {}).get(_CACHE_MULTI_SHEET_KEY) == b"1":
+            with self._log_lock:
+                self.log_issues.append(_MULTI_SHEET_WARNING)
+
+        return table.to_pandas()
+
+    def __save_cache(self, file, df):
+        """Save DataFrame to cache.
+
+        Private sub-method called by load.  Cache entries for older
+        versions of the same file are removed.  DataFrames parquet
+        cannot store are not cached and a warning is logged.  Whether
+        the file had multiple data worksheets (df.attrs, set by
+        __load_excel) is stored in the entry's parquet metadata.
+
+        Parameters
+        -----------
+        file : str
+            Fully qualified path and file name that was loaded.
+        df : pd.DataFrame
+            DataFrame with contents of file.
+
+        Returns
+        --------
+        None : None
+
+        See Also
+        ---------
+        FileProcessor.load
+        """
+
+        if not self.use_cache or df.empty:
+            return
+
+        cached = self.__cache_name(file)
+
+        pattern = f"{glob.escape(self.__cache_slot(file))}.*.parquet"
+        for stale in glob.glob(pattern):
+            if os.path.normpath(stale) != os.path.normpath(cached):
+                os.remove(stale)
+
+        # write to a temp file first so an interrupted write never leaves a partial cache entry
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df)
+            if df.attrs.get("multiple_sheets"):
+                metadata = dict(table.schema.metadata or {})
+                metadata[_CACHE_MULTI_SHEET_KEY] = b"1"
+                table = table.replace_schema_metadata(metadata)
+            pq.write_table(table, f"{cached}.tmp", compression="snappy")
+        except (ImportError, ValueError, TypeError, NotImplementedError) as err:
+            with self._log_lock:
+                self.log_issues.append(
+                    f"\n- Warning: could not cache '{file}' ({err}). \n\tFile will be parsed again next run."
+                )
+            if os.path.exists(f"{cached}.tmp"):
+                os.remove(f"{cached}.tmp")
+            return
+        os.replace(f"{cached}.tmp", cached)
+
+        return
 
     def __load_excel(self, file):
         """Load Excel file to DataFrame.
 
         Private file loading sub-method called by load.
 
+        Uses the calamine engine when python-calamine is installed and pandas
+        supports it (2.2+).  Otherwise the pandas default engine is used
+        (openpyxl for xlsx, which pandas already opens read-only).
+
+        df.attrs["multiple_sheets"] records whether the workbook had more
+        than one data worksheet (stored with the cache entry, see load).
+
         Parameters
         -----------
         file : str
@@ -289,29 +690,237 @@ class FileProcessor(_fundingcorp.ProcessFC):
         FileProcessor.load
         """
 
-        xl = pd.ExcelFile(file)
-        sheets = []
-        for name in xl.sheet_names:
-            if not name.startswith("Sheet"):
-                sheets.append(name)
-        # TODO add multi-sheet load
-        if len(sheets) > 1:
-            self.log_issues.append(
-                "\n- Warning: multiple worksheets detected. \n\tOnly first worksheet was loaded."
-            )
-            df = pd.read_excel(xl, sheets[0])
-        elif len(sheets) == 1:
-            df = pd.read_excel(xl, sheets[0])
-        else:
-            df = pd.DataFrame()
+        engine = {"engine": "calamine"} if _PD_CALAMINE else {}
+
+        sheet, multiple = self.__first_sheet(file)
+        if sheet is None:
+            return pd.DataFrame()
+
+        df = pd.read_excel(file, sheet_name=sheet, **engine)
+        df.attrs["multiple_sheets"] = multiple
 
         return df
 
+    def __load_excel_chunked(self, file, chunk_rows):
+        """Load Excel file to DataFrames of at most chunk_rows rows.
+
+        Private file loading sub-method called by load_chunks.
+
+        With python-calamine the sheet's rows are iterated directly and
+        xlsx files without it are streamed with openpyxl in read-only mode,
+        so no more than one chunk of rows is held as Python objects.  xls
+        files without calamine are paged through with skiprows/nrows.
+        The first row of the sheet is used as the header of every chunk.
+
+        Parameters
+        -----------
+        file : str
+            Fully qualified path and file name to be loaded.
+        chunk_rows : int
+            Maximum number of data rows per chunk.
+
+        Yields
+        --------
+        pd.DataFrame
+            Consecutive chunks of the file's contents.
+
+        See Also
+        ---------
+        FileProcessor.load_chunks
+        """
+
+        sheet, _ = self.__first_sheet(file)
+        if sheet is None:
+            return
+
+        if _CALAMINE:
+            rows = CalamineWorkbook.from_path(file).get_sheet_by_name(sheet).iter_rows()
+            rows = ([self.__calamine_cell(v) for v in row] for row in rows)
+            yield from self.__row_chunks(rows, chunk_rows)
+        elif file.lower().endswith(".xlsx"):
+            import openpyxl
+
+            wb = openpyxl.load_workbook(file, read_only=True, data_only=True)
+            try:
+                rows = wb[sheet].iter_rows(values_only=True)
+                yield from self.__row_chunks(rows, chunk_rows)
+            finally:
+                wb.close()
+        else:
+            # xlrd has no row iterator; page through the sheet keeping the header row
+            start = 1
+            while True:
+                df = pd.read_excel(
+                    file,
+                    sheet_name=sheet,
+                    skiprows=range(1, start),
+                    nrows=chunk_rows,
+                    header=0,
+                )
+                if df.empty:
+                    return
+                yield df
+                start += chunk_rows
+
+    @staticmethod
+    def __calamine_cell(value):
+        """Convert a calamine cell value to what read_excel would give.
+
+        calamine returns empty cells as '' and whole numbers as floats.
+        """
+
+        if value == "":
+            return None
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    @staticmethod
+    def __row_chunks(rows, chunk_rows):
+        """Group an iterator of sheet rows (header first) into DataFrames.
+
+        Matches read_excel: blank header cells are named 'Unnamed: <column number>',
+        duplicate header names get '.1', '.2', ... suffixes, trailing rows with
+        no values (e.g., formatted but empty cells) are dropped, and columns
+        with no values in a chunk are float (NaN) rather than object.
+        """
+
+        rows = iter(rows)
+        header = next(rows, None)
+        if header is None:
+            return
+
+        names = []
+        counts = {}
+        for i, name in enumerate(header):
+            if name is None or name == "":
+                name = f"Unnamed: {i}"
+            count = counts.get(name, 0)
+            while count > 0:
+                counts[name] = count + 1
+                name = f"{name}.{count}"
+                count = counts.get(name, 0)
+            names.append(name)
+            counts[name] = count + 1
+
+        rows = FileProcessor.__drop_trailing_empty(rows)
+
+        while True:
+            chunk = list(islice(rows, chunk_rows))
+            if not chunk:
+                return
+            df = pd.DataFrame(chunk, columns=names)
+
+            # a column with no values in this chunk would otherwise be object dtype
+            empty = df.columns[(df.dtypes == object) & df.isna().all()]
+            if len(empty):
+                df[empty] = df[empty].astype("float64")
+
+            yield df
+
+    @staticmethod
+    def __drop_trailing_empty(rows):
+        """Yield rows, holding back empty rows until a row with values follows."""
+
+        empty = []
+        for row in rows:
+            if all(value is None for value in row):
+                empty.append(row)
+                continue
+            yield from empty
+            empty.clear()
+            yield row
+
+    def __first_sheet(self, file):
+        """Get name of the first data worksheet of an Excel file.
+
+        Private sub-method called by the Excel loaders.  Worksheets with
+        default names (Sheet1, Sheet2, ..., see self.sheet_skip_re) are
+        skipped.  A warning is logged if the workbook has more than one
+        data worksheet.
+
+        Parameters
+        -----------
+        file : str
+            Fully qualified path and file name of Excel file.
+
+        Returns
+        --------
+        tuple
+            Worksheet name (None if the workbook has no data worksheet) and
+            whether the workbook has more than one data worksheet.
+
+        See Also
+        ---------
+        FileProcessor.__load_excel, FileProcessor.__load_excel_chunked
+        """
+
+        # stop scanning once the first and (if any) a second data sheet are found
+        sheets = (
+            name
+            for name in self.__sheet_names(file)
+            if not self.sheet_skip_re.match(name)
+        )
+        sheet = next(sheets, None)
+
+        # TODO add multi-sheet load
+        multiple = sheet is not None and next(sheets, None) is not None
+        if multiple:
+            with self._log_lock:
+                self.log_issues.append(_MULTI_SHEET_WARNING)
+
+        return sheet, multiple
+
+    def __sheet_names(self, file):
+        """Get worksheet names of an Excel file.
+
+        Private sub-method called by __load_excel.  Lists sheets without
+        building a pd.ExcelFile: calamine only indexes the archive and
+        openpyxl's read-only mode skips cell and style parsing.  xls files
+        without calamine fall back to pd.ExcelFile (xlrd has no cheaper
+        sheet listing).
+
+        Parameters
+        -----------
+        file : str
+            Fully qualified path and file name of Excel file.
+
+        Returns
+        --------
+        list
+            Worksheet names in workbook order.
+
+        See Also
+        ---------
+        FileProcessor.__load_excel
+        """
+
+        if _CALAMINE:
+            return CalamineWorkbook.from_path(file).sheet_names
+
+        if file.lower().endswith(".xlsx"):
+            import openpyxl
+
+            wb = openpyxl.load_workbook(file, read_only=True, data_only=True)
+            sheet_names = wb.sheetnames
+            wb.close()  # read-only workbooks keep the file open until closed
+            return sheet_names
+
+        with pd.ExcelFile(file) as xl:
+            return xl.sheet_names
+
     def __load_html(self, file):
         """Load HTML or EML file to DataFrame.
 
         Private file loading sub-method called by load.
 
+        The document is parsed once with lxml and the table with the most
+        cells (rows x widest row, counting colspan) is selected.  Only a
+        table's own rows are scored, not those of nested tables, and only
+        the selected table is converted to a DataFrame.  If self.html_attrs or self.html_match are set, tables
+        without those attributes or text are skipped (e.g., navigation or
+        layout tables in EML files).
+
         Parameters
         -----------
         file : str
@@ -327,18 +936,42 @@ class FileProcessor(_fundingcorp.ProcessFC):
         FileProcessor.load
         """
 
-        frames = pd.read_html(file)
-        max_frame = frames[0].shape[0] * frames[0].shape[1]
+        tree = lxml.html.parse(file)
+
+        max_cells = 0
+        max_table = None
+        for table in tree.iter("table"):
+            if any(table.get(key) != value for key, value in self.html_attrs.items()):
+                continue
+            if self.html_match and not self.html_match.search(table.text_content()):
+                continue
+            rows = table.xpath("./tr | ./thead/tr | ./tbody/tr | ./tfoot/tr")
+            width = max(
+                (
+                    sum(self.__colspan(cell) for cell in row.xpath("./td | ./th"))
+                    for row in rows
+                ),
+                default=0,
+            )
+            cells = len(rows) * width
+            if cells > max_cells:
+                max_cells = cells
+                max_table = table
 
-        for index, frame in enumerate(frames):
-            if frame.shape[0] * frame.shape[1] > max_frame:
-                max_frame = frame.shape[0] * frame.shape[1]
-                max_index = index
+        if max_table is None:
+            return pd.DataFrame()
 
-        df = frames[max_index]
+        html = lxml.html.tostring(max_table, encoding="unicode", with_tail=False)
+        df = pd.read_html(io.StringIO(html), flavor="lxml", displayed_only=True)[0]
 
         return df
 
+    @staticmethod
+    def __colspan(cell):
+        """Return number of columns spanned by an HTML table cell."""
+        colspan = cell.get("colspan", "").strip()
+        return int(colspan) if colspan.isdigit() and int(colspan) > 0 else 1
+
     def loadable_formats(self, verbose=False):
         """Print list of loadable file formats.
 
@@ -359,16 +992,14 @@ class FileProcessor(_fundingcorp.ProcessFC):
             Message listing loadable file formats.
         """
 
-        message = ["\nFile formats that can be loaded:"]
-        for ext in self.extensions:
-            message.append(f"\t- {ext}")
-        message.append(
-            "\n\tIf you need to load another format, add a sub-method under load()"
-        )
+        message = [
+            "\nFile formats that can be loaded:",
+            *[f"\t- {ext}" for ext in self.extensions],
+            "\n\tIf you need to load another format, add a sub-method under load()",
+        ]
 
         if verbose:
-            for msg in message:
-                print(msg)
+            print("\n".join(message))
 
         return message
 
@@ -390,8 +1021,10 @@ class FileProcessor(_fundingcorp.ProcessFC):
         -----------
         fname : str
             Fully qualified path and file name of file to be processed.
-        df : pd.DataFrame
-            DataFrame with unprocessed file contents.
+        df : pd.DataFrame or iterable
+            DataFrame with unprocessed file contents, or chunks of it (see load_chunks).
+            Each chunk is processed separately and the results combined; chunks are
+            always consumed, so the file's load status is logged.
         proc_yaml : str
             Fully qualified path and file name of yaml with info on data source specific processors.
 
@@ -401,28 +1034,170 @@ class FileProcessor(_fundingcorp.ProcessFC):
             Processed DataFrame suitable for upload to data warehouse.
         """
 
-        file = fname.split("/")[-1]
+        file = os.path.basename(fname)
 
-        processor_info = read_yaml([proc_yaml, file], abort=False)
+        processor_info = self.__processor_info(proc_yaml).get(file)
 
-        if processor_info:
-            df = self.choose_processor(df, processor_info)
+        # processor time for this file, summed over chunks
+        elapsed = 0.0
 
-            if not df.empty:
-                self.log_procs.append(f"{fname}")
-            else:
+        chunked = not isinstance(df, pd.DataFrame)
+        if chunked:
+            # process each chunk from load_chunks (if there is a processor) and combine
+            frames = []
+            for chunk in df:
+                if processor_info:
+                    start = time.perf_counter()
+                    chunk = self.choose_processor(chunk, processor_info)
+                    elapsed += time.perf_counter() - start
+                frames.append(chunk)
+            if not frames:
+                # nothing was loaded; load_chunks has logged the load failure
+                return pd.DataFrame()
+            df = pd.concat(frames, ignore_index=True)
+
+        if processor_info:
+            if not chunked:
+                start = time.perf_counter()
+                df = self.choose_processor(df, processor_info)
+                elapsed = time.perf_counter() - start
+
+            with self._log_lock:
+                if not df.empty:
+                    self.log_procs.append(f"{fname}")
+                    self.log_proctimes.append(
+                        f"{fname} ({processor_info.get('method')}): {elapsed:.3f}s"
+                    )
+                else:
+                    self.log_issues.append(
+                        f"\n- ERROR: no processor found for '{file}'. \n\tAdd processor to data source's mixin class."
+                    )
+                    self.log_procfails.append(f"{fname}")
+        else:
+            with self._log_lock:
                 self.log_issues.append(
-                    f"\n- ERROR: no processor found for '{file}'. \n\tAdd processor to data source's mixin class."
+                    f"\n- ERROR: no entry found for '{file}' in yaml. \n\tVerify entry in {proc_yaml}."
                 )
                 self.log_procfails.append(f"{fname}")
-        else:
-            self.log_issues.append(
-                f"\n- ERROR: no entry found for '{file}' in yaml. \n\tVerify entry in {proc_yaml}."
-            )
-            self.log_procfails.append(f"{fname}")
 
         return df
 
+    def __processor_info(self, proc_yaml):
+        """Get parsed contents of processor yaml.
+
+        Private sub-method called by process.  The yaml is parsed once
+        and reused for every file in a run; it is parsed again only if
+        its modification time changes.
+
+        Parameters
+        -----------
+        proc_yaml : str
+            Fully qualified path and file name of yaml with info on data source specific processors.
+
+        Returns
+        --------
+        dict
+            Processor info keyed by file name (empty if the yaml does not exist).
+
+        See Also
+        ---------
+        FileProcessor.process
+        """
+
+        if not os.path.isfile(proc_yaml):
+            return {}
+
+        mtime = os.path.getmtime(proc_yaml)
+        cached = self._yaml_cache.get(proc_yaml)
+        if cached is None or cached[0] != mtime:
+            with open(proc_yaml, "r") as f:
+                cached = (mtime, yaml.safe_load(f) or {})
+            self._yaml_cache[proc_yaml] = cached
+
+        return cached[1]
+
+    def run(self, fnames, proc_yaml):
+        """Load and process a set of files.
+
+        By default file loads are dispatched to a pool of self.max_workers
+        threads (reading Excel/HTML is I/O heavy and largely releases the GIL)
+        and each loaded DataFrame is processed on the calling thread.
+
+        If self.use_processes is True each file is loaded and processed in a
+        pool of self.max_workers spawned processes instead.  This avoids GIL
+        contention when parsing is pure Python (e.g., xlsx via openpyxl).
+        proc_yaml is parsed before the pool starts, so workers receive it
+        with their copy of this instance rather than each parsing it again.
+        Log entries made by the workers are added to this instance's logs
+        in one batch once all results have been yielded (or the caller stops
+        iterating).
+
+        Results are yielded in the same order as fnames.
+
+        Parameters
+        -----------
+        fnames : dict
+            Dictionary with file names as keys and file extensions as values (see files()).
+        proc_yaml : str
+            Fully qualified path and file name of yaml with info on data source specific processors.
+
+        Yields
+        --------
+        tuple
+            File name and its processed DataFrame for each file that loaded successfully.
+
+        See Also
+        ---------
+        FileProcessor.load, FileProcessor.process
+        """
+
+        files = list(fnames)
+        exts = [fnames[file][0] for file in files]
+
+        if self.use_processes:
+            # parse the yaml once here; workers get it with their pickled copy
+            self.__processor_info(proc_yaml)
+
+            # spawn so workers behave the same on Windows and Linux
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=context
+            ) as executor:
+                results = executor.map(
+                    _load_process,
+                    repeat(self),
+                    files,
+                    exts,
+                    repeat(proc_yaml),
+                    chunksize=8,
+                )
+                # worker log entries are merged into the log lists once, after the batch
+                batch_logs = []
+                try:
+                    for file, (df, loaded, logs) in zip(files, results):
+                        batch_logs.append(logs)
+                        if loaded:
+                            yield file, df
+                finally:
+                    with self._log_lock:
+                        for field in _LOG_FIELDS:
+                            getattr(self, field).extend(
+                                chain.from_iterable(logs[field] for logs in batch_logs)
+                            )
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for file, df in zip(files, executor.map(self.load, files, exts)):
+                if not df.empty:
+                    # process data for upload to data warehouse
+                    yield file, self.process(file, df, proc_yaml)
+
+    @staticmethod
+    def __log_section(msgs):
+        """Format log entries as a bulleted list ('None' if there are no entries)."""
+
+        return "".join(f"\n- {msg}" for msg in msgs) or "\nNone"
+
     def write_log(self, field="all"):
         """Write to log.
 
@@ -452,85 +1227,129 @@ class FileProcessor(_fundingcorp.ProcessFC):
             print(f"{field} is unrecognized option. Log not updated")
             return
 
-        self.log = open(self.log_name, "a")
+        # collect log text in memory and write it to the log in one call
+        buf = io.StringIO()
 
         if field == "all" or field == "issue":
-            if len(self.log_issues) == 0:
-                self.log.write("Warnings or Errors")
-                self.log.write("\n------------------\n")
-                self.log.write("No warnings or errors.")
-            else:
+            if len(self.log_issues) != 0:
                 print("\nThere were warnings or errors. See:")
                 print(f"\t{self.log_name}")
-                self.log.write("Warnings or Errors")
-                self.log.write("\n------------------")
-                for msg in self.log_issues:
-                    self.log.write(f"\t{msg}")
+            body = "".join(f"\t{msg}" for msg in self.log_issues)
+            buf.write(_HDR_ISSUES + (body or "\nNo warnings or errors."))
 
         if field == "all" or field == "load":
-            if len(self.log_loads) == 0:
-                self.log.write("\n\n\nFiles Successfully Loaded")
-                self.log.write("\n-------------------------\n")
-                self.log.write("None")
-            else:
-                self.log.write("\n\n\nFiles Successfully Loaded")
-                self.log.write("\n-------------------------")
-                for msg in self.log_loads:
-                    self.log.write(f"\n- {msg}")
-
-            if len(self.log_loadfails) == 0:
-                self.log.write("\n\n\nFiles Failing Load")
-                self.log.write("\n------------------\n")
-                self.log.write("None")
-            else:
-                self.log.write("\n\n\nFiles Failing Load")
-                self.log.write("\n------------------")
-                for msg in self.log_loadfails:
-                    self.log.write(f"\n- {msg}")
+            buf.write(_HDR_LOADS + self.__log_section(self.log_loads))
+            buf.write(_HDR_LOADFAILS + self.__log_section(self.log_loadfails))
 
         if field == "all" or field == "process":
-            if len(self.log_procs) == 0:
-                self.log.write("\n\n\nFiles Successfully Processed")
-                self.log.write("\n----------------------------\n")
-                self.log.write("None")
-            else:
-                self.log.write("\n\n\nFiles Successfully Processed")
-                self.log.write("\n----------------------------")
-                for msg in self.log_procs:
-                    self.log.write(f"\n- {msg}")
-
-            if len(self.log_procfails) == 0:
-                self.log.write("\n\n\nFiles Failing Processing")
-                self.log.write("\n------------------------\n")
-                self.log.write("None")
-            else:
-                self.log.write("\n\n\nFiles Failing Processing")
-                self.log.write("\n------------------------")
-                for msg in self.log_procfails:
-                    self.log.write(f"\n- {msg}")
+            buf.write(_HDR_PROCS + self.__log_section(self.log_procs))
+            buf.write(_HDR_PROCFAILS + self.__log_section(self.log_procfails))
+            if len(self.log_proctimes) != 0:
+                buf.write(_HDR_PROCTIMES + self.__log_section(self.log_proctimes))
+
+        if self.log is None or self.log.closed:
+            self.log = open(self.log_name, "a", buffering=65536)
+        self.log.write(buf.getvalue())
+        self.log.flush()
+
+        return
+
+    def close_log(self):
+        """Close the log.
+
+        The log file is kept open between write_log calls.  Call close_log
+        (or use FileProcessor as a context manager) to release it.  A later
+        write_log call reopens the log in append mode.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None : None
+
+        Examples
+        ---------
+        .. code-block:: python
+
+          with FileProcessor(path) as processor:
+              for file, df in processor.run(processor.files(), proc_yaml):
+                  print(df.head())
+              processor.write_log()
+        """
 
-        self.log.close()
+        log = getattr(self, "log", None)
+        if log is not None and not log.closed:
+            log.close()
 
         return
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close_log()
+
+    def __del__(self):
+        self.close_log()
+
+
+def _load_process(processor, fname, fext, proc_yaml):
+    """Load and process one file in a worker process.
+
+    Module level so it can be pickled by ProcessPoolExecutor.
+
+    Parameters
+    -----------
+    processor : FileProcessor
+        Worker copy of the FileProcessor instance.
+    fname : str
+        Fully qualified path and file name to be loaded.
+    fext : str
+        File extension denoting file type of file to be loaded.
+    proc_yaml : str
+        Fully qualified path and file name of yaml with info on data source specific processors.
+
+    Returns
+    --------
+    tuple
+        Processed DataFrame, whether the file loaded, and dict of log entries made by the worker.
+
+    See Also
+    ---------
+    FileProcessor.run
+    """
+
+    df = processor.load(fname, fext)
+    loaded = not df.empty
+    if loaded:
+        df = processor.process(fname, df, proc_yaml)
+
+    # files in a chunk share one worker copy, so hand back and reset its log lists
+    logs = {}
+    for field in _LOG_FIELDS:
+        logs[field] = getattr(processor, field)
+        setattr(processor, field, [])
+
+    return df, loaded, logs
+
 
 if __name__ == "__main__":
-    # execute only if run as a script
+    # execute only if run as a script: python -m fileprocr.FileProcessor
 
     print("\n")
     path = "M:/Documentsmy/projects/PublicReportingPlatform/FilesForUpload"
-    proc_yaml = "M:/Documentsmy/projects/PublicReportingPlatform/processors/processors.yml"
+    proc_yaml = (
+        "M:/Documentsmy/projects/PublicReportingPlatform/processors/processors.yml"
+    )
 
-    processor = FileProcessor(path)
-    fnames = processor.files()
+    with FileProcessor(path, use_processes=True) as processor:
+        fnames = processor.files()
 
-    for file, ext in fnames.items():
-        df = processor.load(file, ext[0])
-        if not df.empty:
-            # process data for upload to data warehouse
-            df = processor.process(file, df, proc_yaml)
+        for file, df in processor.run(fnames, proc_yaml):
             print(df.head())
 
-    # TODO build processors for specific files (use Mixins)
+        # TODO build processors for specific files (use Mixins)
 
-    processor.write_log()
+        processor.write_log()
@@ -7,20 +7,88 @@ Classes:
     | :class:`fileprocr.FileProcessor.FileProcessor` - Loads and processes sets of flat files (ETL)
     | :class:`fileprocr._fundingcorp.ProcessFC` - Methods for processing data sent from Funding Corp
 
+Functions:
+    | :func:`fileprocr._fundingcorp.vectorized` - Decorator for processor methods (iterrows check)
+
 -----------------------------------------------------------------------------------------------------
 """
 
+import warnings
 import pandas as pd
 
 
+def _uses_iterrows(code):
+    """Check whether a code object (or any nested function) calls iterrows."""
+
+    if "iterrows" in code.co_names:
+        return True
+    return any(
+        _uses_iterrows(const)
+        for const in code.co_consts
+        if hasattr(const, "co_names")
+    )
+
+
+def vectorized(func):
+    """Decorate a processor method.
+
+    Processors must be written with vectorized pandas operations
+    (.assign, .loc, .where, groupby, merge).  A warning is raised when
+    the decorated method calls DataFrame.iterrows.  Processor run times
+    are recorded per file by FileProcessor.process.
+
+    Parameters
+    -----------
+    func : function
+        Processor method taking and returning a pd.DataFrame.
+
+    Returns
+    --------
+    function
+        The processor method, unchanged.
+    """
+
+    if _uses_iterrows(func.__code__):
+        warnings.warn(
+            f"{func.__qualname__} uses DataFrame.iterrows; use vectorized pandas "
+            "operations or itertuples(index=False, name=None) instead.",
+            stacklevel=2,
+        )
+
+    return func
+
+
 class ProcessFC:
     """Mixin class used by FileProcessor to process Funding Corp data files.
 
+    Notes
+    ------
+    Processors are decorated with :func:`vectorized` and should use vectorized
+    pandas operations rather than looping over rows with iterrows.
+
+    .. code-block:: python
+
+      @vectorized
+      def __my_processor(self, df):
+          df = df.assign(total=df["price"] * df["quantity"])
+          df.loc[df["total"] < 0, "total"] = 0
+          return df
+
+    Where row iteration cannot be avoided use ``df.itertuples(index=False, name=None)``
+    or ``zip(*[df[c] for c in cols])``, which yield plain tuples.
+
     See Also
     ---------
     :class:`fileprocr.FileProcessor.FileProcessor`: Base data processing class.
     """
 
+    # processor method names (from the yaml) mapped to their private methods
+    # add an entry here when a new processor method is added below
+    _PROCESSORS = {
+        "avg_bal_tb": "_ProcessFC__avg_bal_tb",
+        "bal_sheet_tb": "_ProcessFC__bal_sheet_tb",
+    }
+
     #############################################
     # PUBLIC METHOD TO SELECT CORRECT PROCESSOR #
     #############################################
@@ -55,17 +123,17 @@ class ProcessFC:
         Notes
         ------
         Users need to add new processors methods if additional
-        Funding Corp data files are provided.
+        Funding Corp data files are provided, and register them in
+        ProcessFC._PROCESSORS.
         """
 
         proc_name = proc_info.get("method")
 
-        if proc_name == "avg_bal_tb":
-            df = self.__avg_bal_tb(df)
-        elif proc_name == "bal_sheet_tb":
-            df = self.__bal_sheet_tb(df)
-        else:
-            df = pd.DataFrame()
+        method = getattr(self, self._PROCESSORS.get(proc_name, ""), None)
+        if method is None:
+            return pd.DataFrame()
+
+        df = method(df)
 
         return df
 
@@ -75,6 +143,7 @@ class ProcessFC:
 
     # Add new methods below if new data sources are provided.
 
+    @vectorized
     def __avg_bal_tb(self, df):
         """Process Average Balances TB xls.
 
@@ -98,6 +167,7 @@ class ProcessFC:
         df = df
         return df
 
+    @vectorized
     def __bal_sheet_tb(self, df):
         """Process Balance Sheet TB xls.
 
@@ -0,0 +1,44 @@
+"""Check that FileProcessor.load_chunks returns the same data as load()."""
+
+import openpyxl
+import pandas as pd
+import pytest
+from openpyxl.styles import Font
+
+import fileprocr.FileProcessor as fp
+
+
+@pytest.fixture
+def workbook(tmp_path, monkeypatch):
+    # FileProcessor writes its log to ./logs
+    monkeypatch.chdir(tmp_path)
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["a", "a", "b", None])
+    ws.append([1, 2, "x", 1.5])
+    ws.append([None, 3, "y", 2.5])
+    ws.append([4, None, "z", None])
+    ws.append([5, 6, "w", 3.5])
+    ws["A20"].font = Font(bold=True)  # formatted but empty cell
+    fname = str(tmp_path / "data.xlsx")
+    wb.save(fname)
+
+    return fname
+
+
+@pytest.mark.parametrize("calamine", [True, False])
+@pytest.mark.parametrize("chunk_rows", [2, 50_000])
+def test_load_chunks_matches_load(workbook, monkeypatch, calamine, chunk_rows):
+    if calamine and not fp._CALAMINE:
+        pytest.skip("python-calamine not installed")
+    monkeypatch.setattr(fp, "_CALAMINE", calamine)
+    monkeypatch.setattr(fp, "_PD_CALAMINE", calamine and fp._PD_CALAMINE)
+
+    with fp.FileProcessor(".") as processor:
+        df = processor.load(workbook, "xlsx")
+        chunks = list(processor.load_chunks(workbook, "xlsx", chunk_rows=chunk_rows))
+
+    assert list(df.columns) == ["a", "a.1", "b", "Unnamed: 3"]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)